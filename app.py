@@ -114,13 +114,43 @@ def api_derive():
         data = request.get_json(force=True)
         method = str(data.get("method", "")).lower()
         func_str = data.get("function", "")
-        x = float(data.get("x", 0))
+        x_raw = data.get("x", 0)
         h = float(data.get("h", 0.001))
         order = int(data.get("order", 1))
+        acc_order = int(data.get("acc_order", 2))
 
         if method not in {"adelante", "atras", "centrada"}:
             return jsonify(error="Método inválido para derivación."), 400
 
+        # Lote de puntos: una lista de x se procesa con una sola compilación
+        # y una única evaluación vectorizada de la función
+        if isinstance(x_raw, list):
+            try:
+                xs = [float(val) for val in x_raw]
+            except (ValueError, TypeError):
+                return jsonify(error="Todos los valores de x deben ser números."), 400
+
+            if method == "adelante":
+                result, formula = diff_adelante_vec(func_str, xs, h, order)
+                explanation = get_adelante_explanation(func_str, xs, h, order)
+            elif method == "atras":
+                result, formula = diff_atras_vec(func_str, xs, h, order)
+                explanation = get_atras_explanation(func_str, xs, h, order)
+            elif method == "centrada":
+                result, formula = diff_centrada_vec(func_str, xs, h, order)
+                explanation = get_centrada_explanation(func_str, xs, h, order)
+
+            return jsonify({
+                "success": True,
+                "method": method,
+                "input": {"function": func_str, "x": xs, "h": h, "order": order},
+                "result": result,
+                "formula": formula,
+                "explanation": explanation
+            })
+
+        x = float(x_raw)
+
         if method == "adelante":
             result, formula = diff_adelante(func_str, x, h, order)
             explanation = get_adelante_explanation(func_str, x, h, order)
@@ -128,7 +158,7 @@ def api_derive():
             result, formula = diff_atras(func_str, x, h, order)
             explanation = get_atras_explanation(func_str, x, h, order)
         elif method == "centrada":
-            result, formula = diff_centrada(func_str, x, h, order)
+            result, formula = diff_centrada(func_str, x, h, order, acc_order)
             explanation = get_centrada_explanation(func_str, x, h, order)
 
         return jsonify({
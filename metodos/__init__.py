@@ -21,6 +21,7 @@ from .interpolacion import (
     newton_divided_diffs,
     eval_newton_poly,
     lagrange_interpolate,
+    LagrangeInterpolator,
     cubic_spline_interpolate,
     get_linear_explanation,
     get_newton_explanation,
@@ -31,9 +32,15 @@ from .interpolacion import (
 # Importar métodos de integración
 from .integracion import (
     trapecio_compuesto,
+    trapecio_compuesto_precompiled,
     simpson_13_compuesto,
+    simpson_13_compuesto_precompiled,
     simpson_38_compuesto,
+    simpson_38_compuesto_precompiled,
     gauss_legendre,
+    gauss_legendre_precompiled,
+    gauss_legendre_adaptive,
+    adaptive_quadpack,
     get_trapecio_explanation,
     get_simpson13_explanation,
     get_simpson38_explanation,
@@ -45,6 +52,9 @@ from .derivacion import (
     diff_adelante,
     diff_atras,
     diff_centrada,
+    diff_adelante_vec,
+    diff_atras_vec,
+    diff_centrada_vec,
     compare_methods,
     estimate_error,
     get_adelante_explanation,
@@ -59,6 +69,7 @@ __all__ = [
     'newton_divided_diffs', 
     'eval_newton_poly',
     'lagrange_interpolate',
+    'LagrangeInterpolator',
     'cubic_spline_interpolate',
     'get_linear_explanation',
     'get_newton_explanation',
@@ -67,9 +78,15 @@ __all__ = [
     
     # Integración
     'trapecio_compuesto',
+    'trapecio_compuesto_precompiled',
     'simpson_13_compuesto',
+    'simpson_13_compuesto_precompiled',
     'simpson_38_compuesto',
+    'simpson_38_compuesto_precompiled',
     'gauss_legendre',
+    'gauss_legendre_precompiled',
+    'gauss_legendre_adaptive',
+    'adaptive_quadpack',
     'get_trapecio_explanation',
     'get_simpson13_explanation',
     'get_simpson38_explanation',
@@ -79,6 +96,9 @@ __all__ = [
     'diff_adelante',
     'diff_atras',
     'diff_centrada',
+    'diff_adelante_vec',
+    'diff_atras_vec',
+    'diff_centrada_vec',
     'compare_methods',
     'estimate_error',
     'get_adelante_explanation',
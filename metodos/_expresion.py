@@ -0,0 +1,51 @@
+# metodos/_expresion.py
+"""Vía rápida compartida para compilar expresiones f(x) a bytecode.
+
+derivacion e integracion usan esta única implementación para que la lista
+blanca de nombres y sus comprobaciones de seguridad no diverjan entre
+módulos.
+"""
+
+import types
+import numpy as np
+from typing import Callable
+
+# Nombres permitidos para el evaluador rápido (sin pasar por sympy)
+_ALLOWED_NAMES = {
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+    'exp': np.exp, 'log': np.log, 'ln': np.log,
+    'sqrt': np.sqrt, 'abs': np.abs,
+    'pi': np.pi, 'e': np.e,
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+    'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan,
+    'pow': pow, 'log10': np.log10
+}
+
+def _compile_fast(func_str: str) -> Callable[[float], float]:
+    """Compila la expresión directamente a bytecode de Python si solo usa
+    nombres de la lista blanca; evita todo el costo de sympify/lambdify.
+
+    Devuelve None si la expresión no es apta para la vía rápida.
+    """
+    try:
+        code = compile(func_str, '<funcion>', 'eval')
+    except SyntaxError:
+        return None
+
+    # Sin lambdas ni comprensiones: compilan a objetos código anidados en
+    # co_consts cuyos co_names no pasarían por la lista blanca de abajo, y
+    # una expresión matemática no los necesita
+    if any(isinstance(const, types.CodeType) for const in code.co_consts):
+        return None
+
+    # Solo se admiten nombres conocidos (sin atributos ni builtins)
+    if not set(code.co_names) <= set(_ALLOWED_NAMES) | {'x'}:
+        return None
+
+    globs = {'__builtins__': {}}
+    globs.update(_ALLOWED_NAMES)
+
+    def func(x):
+        return eval(code, globs, {'x': x})
+
+    return func
@@ -1,96 +1,230 @@
+import functools
+import math
+import os
+import threading
 import numpy as np
 import sympy as sp
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List, Tuple, Dict, Any, Callable
 
-def _parse_function(func_str: str) -> Callable[[float], float]:
-    """Convierte string de función a función evaluable de forma segura"""
-    if not func_str or not func_str.strip():
-        raise ValueError("La función no puede estar vacía")
-    
-    func_str = func_str.strip().replace('^', '**')
-    
+from ._expresion import _compile_fast
+
+# Pool para derivación simbólica: sp.diff puede tardar decenas de ms en
+# expresiones no triviales y no debe bloquear el hilo que atiende la petición
+_EXACT_POOL = ThreadPoolExecutor(max_workers=2)
+
+try:
+    from numba import njit
+except ImportError:  # numba es opcional: sin él se usa la versión numpy
+    njit = None
+
+# Compilar a ufunc C real (sympy.autowrap) elimina las capas Python del
+# wrapper de lambdify, pero tarda varios segundos por expresión nueva, así
+# que solo se activa explícitamente (p.ej. para uso por lotes/offline)
+_USE_UFUNCIFY = os.environ.get("METODOS_UFUNCIFY") == "1"
+
+def _ufuncify_expr(expr, x):
+    """Intenta compilar la expresión a un ufunc en C; None si no procede"""
+    global _USE_UFUNCIFY
+    if not _USE_UFUNCIFY:
+        return None
     try:
-        x = sp.Symbol('x')
-        expr = sp.sympify(func_str, locals={'x': x})
-        func = sp.lambdify(x, expr, 'numpy')
-        
-        # Probar que funcione
-        test_val = func(1.0)
-        if not isinstance(test_val, (int, float, np.number)) or np.isnan(test_val):
-            if not np.isinf(test_val):  # Infinito puede ser válido en algunos casos
-                raise ValueError("La función no devuelve valores numéricos válidos")
-        
+        from sympy.utilities.autowrap import ufuncify
+        return ufuncify([x], expr)
+    except Exception:
+        # Sin toolchain de compilación: no volver a intentarlo
+        _USE_UFUNCIFY = False
+        return None
+
+# Los hits del lru_cache no tocan el lock; solo las compilaciones nuevas se
+# serializan para que varios hilos del worker no dupliquen trabajo de sympy
+_compile_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=256)
+def _compile_function(func_str: str) -> Callable[[float], float]:
+    """Compila un string ya normalizado a función evaluable (cacheado por string)"""
+    with _compile_lock:
+        return _compile_function_impl(func_str)
+
+def _compile_function_impl(func_str: str) -> Callable[[float], float]:
+    try:
+        # Vía rápida: bytecode directo con funciones numpy para las
+        # expresiones típicas; sympy queda como respaldo general
+        func = _compile_fast(func_str)
+
+        if func is None:
+            x = sp.Symbol('x')
+            expr = sp.sympify(func_str, locals={'x': x})
+            func = _ufuncify_expr(expr, x)
+            if func is None:
+                # cse=True factoriza subexpresiones repetidas (p.ej. el
+                # sin(x) de sin(x)*exp(x) + sin(x)**2 se evalúa una vez
+                # por punto de la malla en lugar de dos)
+                func = sp.lambdify(x, expr, 'numpy', cse=True)
+
+        # Sin evaluación de prueba: una sonda en x=1 duplicaba el costo de
+        # cada parseo nuevo y fallaba para funciones no definidas ahí (p.ej.
+        # log(x-1)); los chequeos de finitud en diff_* detectan funciones
+        # realmente inválidas en el punto que importa
         return func
-    
+
     except Exception as e:
         raise ValueError(f"Error al parsear la función '{func_str}': {str(e)}")
 
+def _parse_function(func_str: str) -> Callable[[float], float]:
+    """Convierte string de función a función evaluable de forma segura.
+
+    El trabajo pesado de sympify/lambdify se cachea por string normalizado,
+    de modo que peticiones repetidas con la misma expresión solo pagan un
+    lookup de diccionario.
+    """
+    if not func_str or not str(func_str).strip():
+        raise ValueError("La función no puede estar vacía")
+
+    return _compile_function(str(func_str).strip().replace('^', '**'))
+
+@functools.lru_cache(maxsize=256)
+def _exact_derivative_func(func_str: str, order: int) -> Callable[[float], float]:
+    """Deriva simbólicamente y lambdifica (cacheado por expresión y orden)"""
+    x_sym = sp.Symbol('x')
+    expr = sp.sympify(func_str.replace('^', '**'), locals={'x': x_sym})
+    exact_expr = sp.diff(expr, x_sym, order)
+    return sp.lambdify(x_sym, exact_expr, 'numpy')
+
 def _validate_derivative_params(x: float, h: float, order: int) -> None:
-    """Valida parámetros de derivación"""
-    if not isinstance(x, (int, float)) or np.isnan(x) or np.isinf(x):
+    """Valida parámetros de derivación.
+
+    El handler de Flask ya coaccionó x/h con float() y order con int(), así
+    que bastan comparaciones numéricas nativas: una comparación encadenada
+    para h (falsa también para NaN) y math.isfinite para x, sin pasar por el
+    despacho de ufuncs de numpy.
+    """
+    if not math.isfinite(x):
         raise ValueError(f"Punto de evaluación 'x' no válido: {x}")
-    
-    if not isinstance(h, (int, float)) or h <= 0 or np.isnan(h) or np.isinf(h):
-        raise ValueError(f"Paso 'h' debe ser positivo: {h}")
-    
-    if h > 1.0:
-        raise ValueError(f"Paso 'h' demasiado grande, puede causar errores: {h}")
-    
-    if h < 1e-12:
+
+    if not 1e-12 <= h <= 1.0:
+        if not 0 < h < math.inf:
+            raise ValueError(f"Paso 'h' debe ser positivo: {h}")
+        if h > 1.0:
+            raise ValueError(f"Paso 'h' demasiado grande, puede causar errores: {h}")
         raise ValueError(f"Paso 'h' demasiado pequeño, puede causar errores numéricos: {h}")
-    
-    if not isinstance(order, int) or order < 1 or order > 4:
+
+    if order not in (1, 2, 3, 4):
         raise ValueError(f"Orden de derivada debe ser 1, 2, 3 o 4: {order}")
 
+# ============= STENCILS DE DIFERENCIAS FINITAS =============
+# Por orden de derivada: (offsets, coeficientes) tales que
+# derivada ≈ (coeficientes · f(x + h*offsets)) / h^orden.
+# Tenerlos precomputados permite evaluar la función una sola vez
+# sobre el vector de puntos en lugar de 2-5 llamadas escalares.
+def _binomial_coef(order: int) -> np.ndarray:
+    """Coeficientes binomiales con signo alternado (triángulo de Pascal)"""
+    return np.array([(-1)**(order - i) * math.comb(order, i) for i in range(order + 1)],
+                    dtype=np.float64)
+
+# Adelante: offsets [0..k]. Atrás: offsets [-k..0]; en orden ascendente
+# los coeficientes binomiales alternados son los mismos que hacia adelante.
+_FWD_STENCILS = {k: (np.arange(k + 1), _binomial_coef(k)) for k in range(1, 5)}
+_BWD_STENCILS = {k: (np.arange(-k, 1), _binomial_coef(k)) for k in range(1, 5)}
+
+_CEN_STENCILS = {
+    1: (np.array([-1, 1]), np.array([-0.5, 0.5])),
+    2: (np.array([-1, 0, 1]), np.array([1.0, -2.0, 1.0])),
+    3: (np.array([-2, -1, 1, 2]), np.array([-0.5, 1.0, -1.0, 0.5])),
+    4: (np.array([-2, -1, 0, 1, 2]), np.array([1.0, -4.0, 6.0, -4.0, 1.0]))
+}
+
+@functools.lru_cache(maxsize=64)
+def _centered_stencil(order: int, acc_order: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Genera (offsets, coeficientes) del stencil centrado de precisión arbitraria.
+
+    Resuelve el sistema de Taylor sum_k c_k * k^i = m!·δ_{i,m} (algoritmo de
+    Fornberg) para el mínimo número de puntos simétricos que alcanza el orden
+    de precisión pedido. Cacheado por (orden, precisión): el costo del solve
+    se paga una sola vez.
+    """
+    half_width = (order + 1) // 2 - 1 + acc_order // 2
+    offsets = np.arange(-half_width, half_width + 1)
+    n_points = offsets.size
+
+    system = np.vander(offsets, n_points, increasing=True).T.astype(np.float64)
+    rhs = np.zeros(n_points)
+    rhs[order] = math.factorial(order)
+
+    coef = np.linalg.solve(system, rhs)
+    return offsets, coef
+
+# Fórmulas descriptivas por método y orden; son constantes, así que se
+# comparten a nivel de módulo en lugar de reconstruirse en cada llamada
+_FWD_FORMULAS = {
+    1: "f'(x) ≈ [f(x+h) - f(x)] / h",
+    2: "f''(x) ≈ [f(x+2h) - 2f(x+h) + f(x)] / h²",
+    3: "f'''(x) ≈ [f(x+3h) - 3f(x+2h) + 3f(x+h) - f(x)] / h³",
+    4: "f⁽⁴⁾(x) ≈ [f(x+4h) - 4f(x+3h) + 6f(x+2h) - 4f(x+h) + f(x)] / h⁴"
+}
+
+_BWD_FORMULAS = {
+    1: "f'(x) ≈ [f(x) - f(x-h)] / h",
+    2: "f''(x) ≈ [f(x) - 2f(x-h) + f(x-2h)] / h²",
+    3: "f'''(x) ≈ [f(x) - 3f(x-h) + 3f(x-2h) - f(x-3h)] / h³",
+    4: "f⁽⁴⁾(x) ≈ [f(x) - 4f(x-h) + 6f(x-2h) - 4f(x-3h) + f(x-4h)] / h⁴"
+}
+
+_CEN_FORMULAS = {
+    1: "f'(x) ≈ [f(x+h) - f(x-h)] / (2h)",
+    2: "f''(x) ≈ [f(x+h) - 2f(x) + f(x-h)] / h²",
+    3: "f'''(x) ≈ [f(x+2h) - 2f(x+h) + 2f(x-h) - f(x-2h)] / (2h³)",
+    4: "f⁽⁴⁾(x) ≈ [f(x+2h) - 4f(x+h) + 6f(x) - 4f(x-h) + f(x-2h)] / h⁴"
+}
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _apply_stencil(vals, coef, h_pow):
+        """Kernel compilado: (coef · vals) / h^orden sin despacho de Python"""
+        s = 0.0
+        for i in range(coef.size):
+            s += coef[i] * vals[i]
+        return s / h_pow
+else:
+    def _apply_stencil(vals, coef, h_pow):
+        """Versión numpy del kernel para entornos sin numba"""
+        return float(coef @ vals) / h_pow
+
+def _h_pow(h: float, order: int) -> float:
+    """h^orden para orden 1-4 con multiplicaciones encadenadas,
+    evitando el despacho genérico de float.__pow__"""
+    p = h
+    if order >= 2:
+        p *= h
+    if order >= 3:
+        p *= h
+    if order == 4:
+        p *= h
+    return p
+
+def _eval_stencil(func: Callable, x: float, h: float, offsets: np.ndarray) -> np.ndarray:
+    """Evalúa la función en todos los puntos del stencil con una sola llamada vectorizada"""
+    vals = np.asarray(func(x + h * offsets), dtype=np.float64)
+    if vals.ndim == 0:
+        # Funciones constantes devuelven un escalar: expandir al tamaño del stencil
+        vals = np.full(offsets.shape, float(vals))
+    return vals
+
 # ============= DIFERENCIAS HACIA ADELANTE =============
 def diff_adelante(func_str: str, x: float, h: float, order: int = 1) -> Tuple[float, str]:
     """Diferencias finitas hacia adelante"""
     _validate_derivative_params(x, h, order)
     func = _parse_function(func_str)
     
-    try:
-        if order == 1:
-            # f'(x) ≈ [f(x+h) - f(x)] / h
-            fx = func(x)
-            fx_h = func(x + h)
-            derivative = (fx_h - fx) / h
-            formula = "f'(x) ≈ [f(x+h) - f(x)] / h"
-            
-        elif order == 2:
-            # f''(x) ≈ [f(x+2h) - 2f(x+h) + f(x)] / h²
-            fx = func(x)
-            fx_h = func(x + h)
-            fx_2h = func(x + 2*h)
-            derivative = (fx_2h - 2*fx_h + fx) / (h**2)
-            formula = "f''(x) ≈ [f(x+2h) - 2f(x+h) + f(x)] / h²"
-            
-        elif order == 3:
-            # f'''(x) ≈ [f(x+3h) - 3f(x+2h) + 3f(x+h) - f(x)] / h³
-            fx = func(x)
-            fx_h = func(x + h)
-            fx_2h = func(x + 2*h)
-            fx_3h = func(x + 3*h)
-            derivative = (fx_3h - 3*fx_2h + 3*fx_h - fx) / (h**3)
-            formula = "f'''(x) ≈ [f(x+3h) - 3f(x+2h) + 3f(x+h) - f(x)] / h³"
-            
-        elif order == 4:
-            # f⁽⁴⁾(x) ≈ [f(x+4h) - 4f(x+3h) + 6f(x+2h) - 4f(x+h) + f(x)] / h⁴
-            fx = func(x)
-            fx_h = func(x + h)
-            fx_2h = func(x + 2*h)
-            fx_3h = func(x + 3*h)
-            fx_4h = func(x + 4*h)
-            derivative = (fx_4h - 4*fx_3h + 6*fx_2h - 4*fx_h + fx) / (h**4)
-            formula = "f⁽⁴⁾(x) ≈ [f(x+4h) - 4f(x+3h) + 6f(x+2h) - 4f(x+h) + f(x)] / h⁴"
-            
-        # Verificar que el resultado sea válido
-        if np.isnan(derivative) or np.isinf(derivative):
-            raise ValueError(f"El cálculo resultó en {derivative}. Intenta con un h diferente.")
-            
-        return float(derivative), formula
-        
-    except Exception as e:
-        raise ValueError(f"Error al calcular derivada hacia adelante: {str(e)}")
+    offsets, coef = _FWD_STENCILS[order]
+    vals = _eval_stencil(func, x, h, offsets)
+    derivative = _apply_stencil(vals, coef, _h_pow(h, order))
+
+    # Verificar que el resultado sea válido
+    if not math.isfinite(derivative):
+        raise ValueError(f"El cálculo resultó en {derivative}. Intenta con un h diferente.")
+
+    return float(derivative), _FWD_FORMULAS[order]
 
 # ============= DIFERENCIAS HACIA ATRÁS =============
 def diff_atras(func_str: str, x: float, h: float, order: int = 1) -> Tuple[float, str]:
@@ -98,150 +232,170 @@ def diff_atras(func_str: str, x: float, h: float, order: int = 1) -> Tuple[float
     _validate_derivative_params(x, h, order)
     func = _parse_function(func_str)
     
-    try:
-        if order == 1:
-            # f'(x) ≈ [f(x) - f(x-h)] / h
-            fx = func(x)
-            fx_h = func(x - h)
-            derivative = (fx - fx_h) / h
-            formula = "f'(x) ≈ [f(x) - f(x-h)] / h"
-            
-        elif order == 2:
-            # f''(x) ≈ [f(x) - 2f(x-h) + f(x-2h)] / h²
-            fx = func(x)
-            fx_h = func(x - h)
-            fx_2h = func(x - 2*h)
-            derivative = (fx - 2*fx_h + fx_2h) / (h**2)
-            formula = "f''(x) ≈ [f(x) - 2f(x-h) + f(x-2h)] / h²"
-            
-        elif order == 3:
-            # f'''(x) ≈ [f(x) - 3f(x-h) + 3f(x-2h) - f(x-3h)] / h³
-            fx = func(x)
-            fx_h = func(x - h)
-            fx_2h = func(x - 2*h)
-            fx_3h = func(x - 3*h)
-            derivative = (fx - 3*fx_h + 3*fx_2h - fx_3h) / (h**3)
-            formula = "f'''(x) ≈ [f(x) - 3f(x-h) + 3f(x-2h) - f(x-3h)] / h³"
-            
-        elif order == 4:
-            # f⁽⁴⁾(x) ≈ [f(x) - 4f(x-h) + 6f(x-2h) - 4f(x-3h) + f(x-4h)] / h⁴
-            fx = func(x)
-            fx_h = func(x - h)
-            fx_2h = func(x - 2*h)
-            fx_3h = func(x - 3*h)
-            fx_4h = func(x - 4*h)
-            derivative = (fx - 4*fx_h + 6*fx_2h - 4*fx_3h + fx_4h) / (h**4)
-            formula = "f⁽⁴⁾(x) ≈ [f(x) - 4f(x-h) + 6f(x-2h) - 4f(x-3h) + f(x-4h)] / h⁴"
-            
-        # Verificar que el resultado sea válido
-        if np.isnan(derivative) or np.isinf(derivative):
-            raise ValueError(f"El cálculo resultó en {derivative}. Intenta con un h diferente.")
-            
-        return float(derivative), formula
-        
-    except Exception as e:
-        raise ValueError(f"Error al calcular derivada hacia atrás: {str(e)}")
+    offsets, coef = _BWD_STENCILS[order]
+    vals = _eval_stencil(func, x, h, offsets)
+    derivative = _apply_stencil(vals, coef, _h_pow(h, order))
+
+    # Verificar que el resultado sea válido
+    if not math.isfinite(derivative):
+        raise ValueError(f"El cálculo resultó en {derivative}. Intenta con un h diferente.")
+
+    return float(derivative), _BWD_FORMULAS[order]
 
 # ============= DIFERENCIAS CENTRADAS =============
-def diff_centrada(func_str: str, x: float, h: float, order: int = 1) -> Tuple[float, str]:
-    """Diferencias finitas centradas (mayor precisión)"""
+def diff_centrada(func_str: str, x: float, h: float, order: int = 1,
+                  acc_order: int = 2) -> Tuple[float, str]:
+    """Diferencias finitas centradas (mayor precisión).
+
+    acc_order controla el orden de precisión O(h^acc_order): con el valor
+    por defecto (2) se usan los stencils clásicos; valores mayores generan
+    stencils más anchos que permiten usar un h más grande sin perder
+    exactitud, evitando la cancelación sustractiva de h pequeños.
+    """
     _validate_derivative_params(x, h, order)
+    if acc_order not in (2, 4, 6, 8):
+        raise ValueError(f"Orden de precisión debe ser 2, 4, 6 u 8: {acc_order}")
     func = _parse_function(func_str)
-    
-    try:
-        if order == 1:
-            # f'(x) ≈ [f(x+h) - f(x-h)] / (2h)
-            fx_pos = func(x + h)
-            fx_neg = func(x - h)
-            derivative = (fx_pos - fx_neg) / (2*h)
-            formula = "f'(x) ≈ [f(x+h) - f(x-h)] / (2h)"
-            
-        elif order == 2:
-            # f''(x) ≈ [f(x+h) - 2f(x) + f(x-h)] / h²
-            fx = func(x)
-            fx_pos = func(x + h)
-            fx_neg = func(x - h)
-            derivative = (fx_pos - 2*fx + fx_neg) / (h**2)
-            formula = "f''(x) ≈ [f(x+h) - 2f(x) + f(x-h)] / h²"
-            
-        elif order == 3:
-            # f'''(x) ≈ [f(x+2h) - 2f(x+h) + 2f(x-h) - f(x-2h)] / (2h³)
-            fx_2pos = func(x + 2*h)
-            fx_pos = func(x + h)
-            fx_neg = func(x - h)
-            fx_2neg = func(x - 2*h)
-            derivative = (fx_2pos - 2*fx_pos + 2*fx_neg - fx_2neg) / (2*h**3)
-            formula = "f'''(x) ≈ [f(x+2h) - 2f(x+h) + 2f(x-h) - f(x-2h)] / (2h³)"
-            
-        elif order == 4:
-            # f⁽⁴⁾(x) ≈ [f(x+2h) - 4f(x+h) + 6f(x) - 4f(x-h) + f(x-2h)] / h⁴
-            fx = func(x)
-            fx_pos = func(x + h)
-            fx_neg = func(x - h)
-            fx_2pos = func(x + 2*h)
-            fx_2neg = func(x - 2*h)
-            derivative = (fx_2pos - 4*fx_pos + 6*fx - 4*fx_neg + fx_2neg) / (h**4)
-            formula = "f⁽⁴⁾(x) ≈ [f(x+2h) - 4f(x+h) + 6f(x) - 4f(x-h) + f(x-2h)] / h⁴"
-            
-        # Verificar que el resultado sea válido
-        if np.isnan(derivative) or np.isinf(derivative):
-            raise ValueError(f"El cálculo resultó en {derivative}. Intenta con un h diferente.")
-            
-        return float(derivative), formula
-        
-    except Exception as e:
-        raise ValueError(f"Error al calcular derivada centrada: {str(e)}")
+
+    if acc_order == 2:
+        offsets, coef = _CEN_STENCILS[order]
+        formula = _CEN_FORMULAS[order]
+    else:
+        offsets, coef = _centered_stencil(order, acc_order)
+        formula = f"Stencil centrado de {offsets.size} puntos, error O(h^{acc_order})"
+    vals = _eval_stencil(func, x, h, offsets)
+    derivative = _apply_stencil(vals, coef, _h_pow(h, order))
+
+    # Verificar que el resultado sea válido
+    if not math.isfinite(derivative):
+        raise ValueError(f"El cálculo resultó en {derivative}. Intenta con un h diferente.")
+
+    return float(derivative), formula
+
+# ============= VERSIONES VECTORIZADAS (LOTES DE PUNTOS) =============
+def _diff_vec(stencils: Dict, formulas: Dict, func_str: str, xs: List[float],
+              h: float, order: int) -> Tuple[List[float], str]:
+    """Evalúa un stencil sobre un lote de puntos con una sola llamada.
+
+    Construye la malla 2D xs[:,None] + h*offsets[None,:], evalúa la función
+    una única vez y contrae los coeficientes por filas, de modo que obtener
+    la derivada en N puntos cuesta lo mismo (en llamadas Python) que en uno.
+    """
+    xs_arr = np.asarray(xs, dtype=np.float64)
+    if xs_arr.ndim != 1 or xs_arr.size == 0:
+        raise ValueError("Se requiere una lista no vacía de puntos 'x'")
+    if not np.all(np.isfinite(xs_arr)):
+        raise ValueError("Todos los puntos 'x' deben ser números finitos")
+    _validate_derivative_params(float(xs_arr[0]), h, order)
+
+    func = _parse_function(func_str)
+    offsets, coef = stencils[order]
+    grid = xs_arr[:, None] + h * offsets[None, :]
+    vals = np.asarray(func(grid), dtype=np.float64)
+    if vals.ndim == 0:
+        # Funciones constantes devuelven un escalar: expandir a la malla
+        vals = np.full(grid.shape, float(vals))
+
+    derivatives = vals @ coef / _h_pow(h, order)
+    if not np.all(np.isfinite(derivatives)):
+        raise ValueError("El cálculo produjo valores no finitos. Intenta con un h diferente.")
+
+    return derivatives.tolist(), formulas[order]
+
+def diff_adelante_vec(func_str: str, xs: List[float], h: float, order: int = 1) -> Tuple[List[float], str]:
+    """Diferencias hacia adelante evaluadas en un lote de puntos"""
+    return _diff_vec(_FWD_STENCILS, _FWD_FORMULAS, func_str, xs, h, order)
+
+def diff_atras_vec(func_str: str, xs: List[float], h: float, order: int = 1) -> Tuple[List[float], str]:
+    """Diferencias hacia atrás evaluadas en un lote de puntos"""
+    return _diff_vec(_BWD_STENCILS, _BWD_FORMULAS, func_str, xs, h, order)
+
+def diff_centrada_vec(func_str: str, xs: List[float], h: float, order: int = 1) -> Tuple[List[float], str]:
+    """Diferencias centradas evaluadas en un lote de puntos"""
+    return _diff_vec(_CEN_STENCILS, _CEN_FORMULAS, func_str, xs, h, order)
 
 # ============= ANÁLISIS DE ERROR =============
+# Plantillas constantes por método: solo la magnitud depende de h,
+# así que se interpola una única vez por llamada
+_ERROR_TEMPLATES = {
+    "adelante": ("Error ≈ O(h) = O({:.2e})", 1),
+    "atras": ("Error ≈ O(h) = O({:.2e})", 1),
+    "centrada": ("Error ≈ O(h²) = O({:.2e})", 2)
+}
+
 def estimate_error(func_str: str, x: float, h: float, method: str, order: int = 1) -> Dict[str, Any]:
     """Estima el error de truncamiento de los métodos de derivación"""
-    
-    error_formulas = {
-        "adelante": {
-            1: f"Error ≈ O(h) = O({h:.2e})",
-            2: f"Error ≈ O(h) = O({h:.2e})",
-            3: f"Error ≈ O(h) = O({h:.2e})",
-            4: f"Error ≈ O(h) = O({h:.2e})"
-        },
-        "atras": {
-            1: f"Error ≈ O(h) = O({h:.2e})",
-            2: f"Error ≈ O(h) = O({h:.2e})",
-            3: f"Error ≈ O(h) = O({h:.2e})",
-            4: f"Error ≈ O(h) = O({h:.2e})"
-        },
-        "centrada": {
-            1: f"Error ≈ O(h²) = O({h**2:.2e})",
-            2: f"Error ≈ O(h²) = O({h**2:.2e})",
-            3: f"Error ≈ O(h²) = O({h**2:.2e})",
-            4: f"Error ≈ O(h²) = O({h**2:.2e})"
-        }
-    }
-    
+
+    if method in _ERROR_TEMPLATES and order in (1, 2, 3, 4):
+        template, h_exp = _ERROR_TEMPLATES[method]
+        error_formula = template.format(h**h_exp)
+    else:
+        error_formula = "Error no disponible"
+
     return {
         "method": method,
         "order": order,
-        "error_formula": error_formulas.get(method, {}).get(order, "Error no disponible"),
+        "error_formula": error_formula,
         "truncation_order": 2 if method == "centrada" else 1,
         "recommendation": "Usar diferencias centradas para mayor precisión" if method != "centrada" else "Método óptimo seleccionado"
     }
 
 # ============= COMPARACIÓN DE MÉTODOS =============
+def _build_compare_grid(order: int):
+    """Une los stencils adelante/atrás/centrado en una sola malla de offsets.
+
+    Los tres métodos comparten puntos (p.ej. x±h, x±2h), así que basta evaluar
+    la función una vez sobre la unión y leer cada stencil por índices. La malla
+    se expresa en unidades de h/2: los stencils clásicos a paso h viven en los
+    offsets pares y el stencil centrado a paso h/2 en los impares, lo que
+    permite extrapolar con Richardson sin evaluaciones extra de la función.
+    """
+    grids = []
+    stencils = (_FWD_STENCILS[order], _BWD_STENCILS[order], _CEN_STENCILS[order])
+    cen_offsets, _ = _CEN_STENCILS[order]
+    union = np.unique(np.concatenate([2 * offs for offs, _ in stencils] + [cen_offsets]))
+    for offs, coef in stencils:
+        grids.append((np.searchsorted(union, 2 * offs), coef))
+    half_idx = np.searchsorted(union, cen_offsets)
+    return union, grids, half_idx
+
+_COMPARE_GRIDS = {order: _build_compare_grid(order) for order in (1, 2, 3, 4)}
+
 def compare_methods(func_str: str, x: float, h: float, order: int = 1) -> Dict[str, Any]:
     """Compara los tres métodos de diferenciación"""
-    
+    _validate_derivative_params(x, h, order)
+    func = _parse_function(func_str)
+
     try:
-        deriv_adelante, _ = diff_adelante(func_str, x, h, order)
-        deriv_atras, _ = diff_atras(func_str, x, h, order)
-        deriv_centrada, _ = diff_centrada(func_str, x, h, order)
-        
-        # Calcular derivada exacta si es posible
+        # Una sola evaluación vectorizada sobre la unión de los tres stencils
+        # (malla a paso h/2 para disponer también de las muestras de Richardson)
+        union, grids, half_idx = _COMPARE_GRIDS[order]
+        vals = _eval_stencil(func, x, 0.5 * h, union)
+        h_pow = _h_pow(h, order)
+
+        (fwd_idx, fwd_coef), (bwd_idx, bwd_coef), (cen_idx, cen_coef) = grids
+        deriv_adelante = _apply_stencil(vals[fwd_idx], fwd_coef, h_pow)
+        deriv_atras = _apply_stencil(vals[bwd_idx], bwd_coef, h_pow)
+        deriv_centrada = _apply_stencil(vals[cen_idx], cen_coef, h_pow)
+
+        # Extrapolación de Richardson: el error del stencil centrado es
+        # c·h² + O(h⁴), así que combinar las estimaciones a paso h y h/2
+        # cancela el término cuadrático y da una estimación O(h⁴)
+        deriv_half = _apply_stencil(vals[half_idx], cen_coef, _h_pow(0.5 * h, order))
+        deriv_richardson = (4.0 * deriv_half - deriv_centrada) / 3.0
+
+        # Calcular derivada exacta si es posible. La diferenciación simbólica
+        # corre en el pool con una espera corta: si no llega a tiempo se
+        # responde solo con las estimaciones numéricas y se marca pendiente
+        # (el lru_cache deja el resultado listo para la siguiente petición)
         exact_deriv = None
+        exact_pending = False
         try:
-            x_sym = sp.Symbol('x')
-            expr = sp.sympify(func_str.replace('^', '**'))
-            exact_expr = sp.diff(expr, x_sym, order)
-            exact_func = sp.lambdify(x_sym, exact_expr, 'numpy')
+            future = _EXACT_POOL.submit(_exact_derivative_func, str(func_str), order)
+            exact_func = future.result(timeout=0.05)
             exact_deriv = float(exact_func(x))
+        except FutureTimeoutError:
+            exact_pending = True
         except:
             pass
         
@@ -249,14 +403,19 @@ def compare_methods(func_str: str, x: float, h: float, order: int = 1) -> Dict[s
             "adelante": deriv_adelante,
             "atras": deriv_atras,
             "centrada": deriv_centrada,
+            "richardson": deriv_richardson,
             "exact": exact_deriv
         }
-        
+
+        if exact_pending:
+            result["exact_pending"] = True
+
         if exact_deriv is not None:
             result["errors"] = {
                 "adelante": abs(deriv_adelante - exact_deriv),
                 "atras": abs(deriv_atras - exact_deriv),
-                "centrada": abs(deriv_centrada - exact_deriv)
+                "centrada": abs(deriv_centrada - exact_deriv),
+                "richardson": abs(deriv_richardson - exact_deriv)
             }
             
             # Determinar el mejor método
@@ -302,4 +461,14 @@ def get_centrada_explanation(func_str: str, x: float, h: float, order: int) -> D
         "use_case": "Método preferido cuando es posible usarlo",
         "complexity": "O(1) por evaluación",
         "recommendation": "Método recomendado para máxima precisión"
-    }
\ No newline at end of file
+    }
+# ============= PRECALENTAMIENTO =============
+# Con METODOS_PREWARM=1 (p.ej. en los workers de gunicorn) se compilan las
+# expresiones más comunes al importar, de modo que la primera petición real
+# de cada worker ya encuentre el cache caliente
+if os.environ.get("METODOS_PREWARM") == "1":
+    for _expr in ("sin(x)", "cos(x)", "exp(x)", "log(x)", "x**2", "x**3", "1/x"):
+        try:
+            _parse_function(_expr)
+        except ValueError:
+            pass
@@ -1,46 +1,54 @@
+import functools
 import numpy as np
 import sympy as sp
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict, Any, Callable
 
-def _parse_function(func_str: str) -> Callable[[float], float]:
-    """Convierte string de función a función evaluable de forma segura"""
-    if not func_str or not func_str.strip():
-        raise ValueError("La función no puede estar vacía")
-    
-    # Limpiar y preparar la función
-    func_str = func_str.strip().replace('^', '**')
-    
-    # Símbolos permitidos y funciones seguras
-    allowed_names = {
-        'x': None,
-        'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
-        'exp': np.exp, 'log': np.log, 'ln': np.log,
-        'sqrt': np.sqrt, 'abs': np.abs,
-        'pi': np.pi, 'e': np.e,
-        'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
-        'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan,
-        'pow': pow, 'log10': np.log10
-    }
-    
+from ._expresion import _compile_fast
+
+# QUADPACK (vía scipy) es opcional: si está instalado se usa como
+# integrador adaptativo compilado; si no, queda el respaldo puro NumPy
+try:
+    from scipy.integrate import quad as _scipy_quad
+except ImportError:
+    _scipy_quad = None
+
+@functools.lru_cache(maxsize=256)
+def _compile_function(func_str: str) -> Callable[[float], float]:
+    """Compila un string ya normalizado a función evaluable (cacheado por string)"""
     try:
-        # Usar sympy para parsing seguro
-        x = sp.Symbol('x')
-        expr = sp.sympify(func_str, locals={'x': x})
-        
-        # Convertir a función numérica
-        func = sp.lambdify(x, expr, 'numpy')
-        
+        # Vía rápida: bytecode directo con funciones numpy; sympy queda
+        # como respaldo general para lo que la lista blanca rechace
+        func = _compile_fast(func_str)
+
+        if func is None:
+            x = sp.Symbol('x')
+            expr = sp.sympify(func_str, locals={'x': x})
+            func = sp.lambdify(x, expr, 'numpy')
+
         # Probar que funcione
         test_val = func(1.0)
         if not isinstance(test_val, (int, float, np.number)) or np.isnan(test_val):
             if not np.isinf(test_val):  # Infinito puede ser válido en algunos casos
                 raise ValueError("La función no devuelve valores numéricos válidos")
-        
+
         return func
-    
+
     except Exception as e:
         raise ValueError(f"Error al parsear la función '{func_str}': {str(e)}")
 
+def _parse_function(func_str: str) -> Callable[[float], float]:
+    """Convierte string de función a función evaluable de forma segura.
+
+    El trabajo pesado de parseo/compilación se cachea por string normalizado,
+    así que integrar la misma expresión con distintos parámetros solo paga
+    un lookup de diccionario.
+    """
+    if not func_str or not str(func_str).strip():
+        raise ValueError("La función no puede estar vacía")
+
+    return _compile_function(str(func_str).strip().replace('^', '**'))
+
 def _validate_integration_params(a: float, b: float, n: int) -> None:
     """Valida parámetros de integración"""
     if not isinstance(a, (int, float)) or np.isnan(a) or np.isinf(a):
@@ -58,62 +66,139 @@ def _validate_integration_params(a: float, b: float, n: int) -> None:
     if n > 10000:
         raise ValueError(f"Número de subdivisiones demasiado grande: {n} > 10000")
 
+# Vectores de pesos de las reglas compuestas, cacheados por n: cada regla
+# se reduce a un único producto punto pesos·muestras (BLAS/SIMD)
+@functools.lru_cache(maxsize=64)
+def _trapecio_weights(n: int) -> np.ndarray:
+    """Pesos [1, 2, ..., 2, 1] de la regla del trapecio compuesta"""
+    w = np.full(n + 1, 2.0)
+    w[0] = w[n] = 1.0
+    return w
+
+@functools.lru_cache(maxsize=64)
+def _simpson13_weights(n: int) -> np.ndarray:
+    """Pesos [1, 4, 2, 4, ..., 4, 1] de Simpson 1/3 compuesta"""
+    w = np.ones(n + 1)
+    w[1:n:2] = 4.0
+    w[2:n:2] = 2.0
+    return w
+
+@functools.lru_cache(maxsize=64)
+def _simpson38_weights(n: int) -> np.ndarray:
+    """Pesos [1, 3, 3, 2, 3, 3, 2, ..., 1] de Simpson 3/8 compuesta"""
+    w = np.full(n + 1, 3.0)
+    w[0] = w[n] = 1.0
+    w[3:n:3] = 2.0
+    return w
+
+def _eval_vector(func: Callable, xs: np.ndarray) -> np.ndarray:
+    """Evalúa la función sobre un arreglo de puntos con una sola llamada.
+
+    Los callables que solo aceptan escalares (p. ej. math.sin pasado a una
+    vía *_precompiled) se evalúan punto a punto como respaldo.
+    """
+    try:
+        vals = np.asarray(func(xs), dtype=np.float64)
+    except TypeError:
+        return np.asarray([float(func(xi)) for xi in xs], dtype=np.float64)
+    if vals.ndim == 0:
+        # Funciones constantes devuelven un escalar: expandir al arreglo
+        vals = np.full(xs.shape, float(vals))
+    return vals
+
+def _eval_vector_parallel(func: Callable, xs: np.ndarray, threads: int) -> np.ndarray:
+    """Evalúa la función por bloques repartidos en un pool de hilos.
+
+    Las ufuncs de NumPy liberan el GIL, así que para integrandos costosos
+    sobre mallas grandes los bloques se evalúan de verdad en paralelo; es
+    el análogo del patrón OpenMP «parallel for + reduction» sobre la malla.
+    """
+    chunks = np.array_split(xs, threads)
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        parts = list(pool.map(lambda chunk: _eval_vector(func, chunk), chunks))
+    return np.concatenate(parts)
+
 # ============= REGLA DEL TRAPECIO =============
 def trapecio_simple(func: Callable, a: float, b: float) -> float:
     """Regla del trapecio simple"""
     return (b - a) * (func(a) + func(b)) / 2
 
-def trapecio_compuesto(func_str: str, a: float, b: float, n: int) -> Tuple[float, List[Dict]]:
-    """Regla del trapecio compuesta con pasos detallados"""
+def trapecio_compuesto(func_str: str, a: float, b: float, n: int,
+                       return_steps: bool = True,
+                       threads: int = 1) -> Tuple[float, List[Dict]]:
+    """Regla del trapecio compuesta con pasos detallados.
+
+    Con return_steps=False se omite por completo la construcción del
+    desglose (dicts y f-strings), dejando solo la aritmética vectorizada.
+    Con threads > 1 el integrando se evalúa por bloques en paralelo, útil
+    para integrandos costosos con n grande.
+    """
+    return trapecio_compuesto_precompiled(_parse_function(func_str), a, b, n,
+                                          return_steps, threads)
+
+def trapecio_compuesto_precompiled(func: Callable, a: float, b: float, n: int,
+                                   return_steps: bool = True,
+                                   threads: int = 1) -> Tuple[float, List[Dict]]:
+    """Regla del trapecio compuesta sobre un integrando ya compilado.
+
+    Los bucles calientes (barridos de convergencia variando n, recursión
+    adaptativa) pagan así el parseo una sola vez y ni siquiera el lookup
+    del caché por llamada.
+    """
     _validate_integration_params(a, b, n)
-    func = _parse_function(func_str)
-    
+    if not isinstance(threads, int) or threads < 1:
+        raise ValueError(f"Número de hilos debe ser entero positivo: {threads}")
+
     h = (b - a) / n
-    steps = []
-    
-    # Evaluar en los extremos
-    fa = func(a)
-    fb = func(b)
-    
-    steps.append({
+
+    # Evaluar toda la malla (extremos incluidos) con una sola llamada
+    # (o por bloques en paralelo si se pidió más de un hilo)
+    xs = a + np.arange(n + 1, dtype=np.float64) * h
+    if threads > 1 and n >= 2 * threads:
+        ys = _eval_vector_parallel(func, xs, threads)
+    else:
+        ys = _eval_vector(func, xs)
+
+    # Aplicar fórmula del trapecio compuesto: un solo producto punto
+    result = h * float(_trapecio_weights(n) @ ys) / 2
+
+    if not return_steps:
+        return result, []
+
+    fa = float(ys[0])
+    fb = float(ys[n])
+    sum_intermediate = float(ys[1:n].sum())
+
+    steps = [{
         "step": 1,
         "description": f"h = (b-a)/n = ({b}-{a})/{n} = {h}",
         "x": a,
         "fx": fa
-    })
-    
-    # Evaluar en puntos intermedios
-    sum_intermediate = 0
-    for i in range(1, n):
-        xi = a + i * h
-        fxi = func(xi)
-        sum_intermediate += fxi
-        
-        if i <= 5:  # Mostrar solo los primeros 5 pasos
-            steps.append({
-                "step": i + 1,
-                "description": f"x_{i} = {xi:.6f}",
-                "x": xi,
-                "fx": fxi
-            })
-    
+    }]
+
+    # Mostrar solo los primeros 5 puntos interiores (sin los extremos)
+    for i, (xi, fxi) in enumerate(zip(xs[1:n][:5], ys[1:n][:5]), start=1):
+        steps.append({
+            "step": i + 1,
+            "description": f"x_{i} = {xi:.6f}",
+            "x": float(xi),
+            "fx": float(fxi)
+        })
+
     steps.append({
         "step": "final",
         "description": f"x_n = {b}",
         "x": b,
         "fx": fb
     })
-    
-    # Aplicar fórmula del trapecio compuesto
-    result = h * (fa + 2 * sum_intermediate + fb) / 2
-    
+
     steps.append({
         "step": "result",
         "description": f"Integral ≈ h/2 * [f(a) + 2*Σf(xi) + f(b)]",
         "formula": f"{h}/2 * [{fa:.6f} + 2*{sum_intermediate:.6f} + {fb:.6f}]",
         "result": result
     })
-    
+
     return result, steps
 
 # ============= REGLA DE SIMPSON 1/3 =============
@@ -122,152 +207,273 @@ def simpson_13_simple(func: Callable, a: float, b: float) -> float:
     c = (a + b) / 2
     return (b - a) * (func(a) + 4 * func(c) + func(b)) / 6
 
-def simpson_13_compuesto(func_str: str, a: float, b: float, n: int) -> Tuple[float, List[Dict]]:
+def simpson_13_compuesto(func_str: str, a: float, b: float, n: int,
+                         return_steps: bool = True) -> Tuple[float, List[Dict]]:
     """Regla de Simpson 1/3 compuesta"""
+    return simpson_13_compuesto_precompiled(_parse_function(func_str), a, b, n,
+                                            return_steps)
+
+def simpson_13_compuesto_precompiled(func: Callable, a: float, b: float, n: int,
+                                     return_steps: bool = True) -> Tuple[float, List[Dict]]:
+    """Regla de Simpson 1/3 compuesta sobre un integrando ya compilado"""
     _validate_integration_params(a, b, n)
-    
+
     # n debe ser par para Simpson
     if n % 2 != 0:
         n += 1
-    
-    func = _parse_function(func_str)
+
     h = (b - a) / n
-    steps = []
-    
-    # Evaluar función en todos los puntos
-    x_vals = [a + i * h for i in range(n + 1)]
-    f_vals = [func(x) for x in x_vals]
-    
-    steps.append({
-        "step": 1,
-        "description": f"h = (b-a)/n = ({b}-{a})/{n} = {h}",
-        "n_adjusted": n
-    })
-    
-    # Suma de términos
-    sum_odd = sum(f_vals[i] for i in range(1, n, 2))
-    sum_even = sum(f_vals[i] for i in range(2, n, 2))
-    
-    result = h * (f_vals[0] + 4 * sum_odd + 2 * sum_even + f_vals[n]) / 3
-    
-    steps.append({
-        "step": "calculation",
-        "f_a": f_vals[0],
-        "f_b": f_vals[n],
-        "sum_odd": sum_odd,
-        "sum_even": sum_even,
-        "result": result
-    })
-    
+
+    # Evaluar función en todos los puntos con una sola llamada vectorizada
+    x_vals = a + np.arange(n + 1, dtype=np.float64) * h
+    f_vals = _eval_vector(func, x_vals)
+
+    result = h * float(_simpson13_weights(n) @ f_vals) / 3
+
+    if not return_steps:
+        return result, []
+
+    # Sumas de términos impares/pares por slicing (solo para el desglose)
+    sum_odd = float(f_vals[1:n:2].sum())
+    sum_even = float(f_vals[2:n:2].sum())
+
+    steps = [
+        {
+            "step": 1,
+            "description": f"h = (b-a)/n = ({b}-{a})/{n} = {h}",
+            "n_adjusted": n
+        },
+        {
+            "step": "calculation",
+            "f_a": float(f_vals[0]),
+            "f_b": float(f_vals[n]),
+            "sum_odd": sum_odd,
+            "sum_even": sum_even,
+            "result": result
+        }
+    ]
+
     return result, steps
 
 # ============= REGLA DE SIMPSON 3/8 =============
-def simpson_38_compuesto(func_str: str, a: float, b: float, n: int) -> Tuple[float, List[Dict]]:
+def simpson_38_compuesto(func_str: str, a: float, b: float, n: int,
+                         return_steps: bool = True) -> Tuple[float, List[Dict]]:
     """Regla de Simpson 3/8 compuesta"""
+    return simpson_38_compuesto_precompiled(_parse_function(func_str), a, b, n,
+                                            return_steps)
+
+def simpson_38_compuesto_precompiled(func: Callable, a: float, b: float, n: int,
+                                     return_steps: bool = True) -> Tuple[float, List[Dict]]:
+    """Regla de Simpson 3/8 compuesta sobre un integrando ya compilado"""
     _validate_integration_params(a, b, n)
-    
+
     # n debe ser múltiplo de 3 para Simpson 3/8
     if n % 3 != 0:
         n = ((n // 3) + 1) * 3
-    
-    func = _parse_function(func_str)
+
     h = (b - a) / n
-    steps = []
-    
-    steps.append({
-        "step": 1,
-        "description": f"h = (b-a)/n = ({b}-{a})/{n} = {h}",
-        "n_adjusted": n
-    })
-    
-    # Evaluar función
-    total = func(a) + func(b)
-    
-    for i in range(1, n):
-        xi = a + i * h
-        fxi = func(xi)
-        if i % 3 == 0:
-            total += 2 * fxi
-        else:
-            total += 3 * fxi
-    
-    result = 3 * h * total / 8
-    
-    steps.append({
-        "step": "result",
-        "description": "Aplicando fórmula de Simpson 3/8",
-        "result": result
-    })
-    
+
+    # Evaluar toda la malla de una vez y contraer contra los pesos
+    # [1, 3, 3, 2, ...] precomputados (sin ramas por iteración)
+    xs = a + np.arange(n + 1, dtype=np.float64) * h
+    fs = _eval_vector(func, xs)
+
+    result = 3 * h * float(_simpson38_weights(n) @ fs) / 8
+
+    if not return_steps:
+        return result, []
+
+    steps = [
+        {
+            "step": 1,
+            "description": f"h = (b-a)/n = ({b}-{a})/{n} = {h}",
+            "n_adjusted": n
+        },
+        {
+            "step": "result",
+            "description": "Aplicando fórmula de Simpson 3/8",
+            "result": result
+        }
+    ]
+
     return result, steps
 
 # ============= CUADRATURA DE GAUSS-LEGENDRE =============
-def gauss_legendre(func_str: str, a: float, b: float, n: int) -> Tuple[float, List[Dict]]:
+@functools.lru_cache(maxsize=64)
+def _gl_nodes_weights(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Nodos y pesos de Gauss-Legendre en doble precisión, cacheados por n.
+
+    leggauss resuelve un problema de autovalores O(n²); cachearlo deja las
+    llamadas repetidas en puro costo de evaluación de la función.
+    """
+    return np.polynomial.legendre.leggauss(n)
+
+# Precalentar las reglas que la API puede pedir (gauss_legendre limita n a
+# 10): son 2n floats por regla y evita pagar el problema de autovalores en
+# la primera petición de cada n
+for _n in range(1, 11):
+    _gl_nodes_weights(_n)
+del _n
+
+def gauss_legendre(func_str: str, a: float, b: float, n: int,
+                   return_steps: bool = True) -> Tuple[float, List[Dict]]:
     """Cuadratura de Gauss-Legendre"""
+    return gauss_legendre_precompiled(_parse_function(func_str), a, b, n,
+                                      return_steps)
+
+def gauss_legendre_precompiled(func: Callable, a: float, b: float, n: int,
+                               return_steps: bool = True) -> Tuple[float, List[Dict]]:
+    """Cuadratura de Gauss-Legendre sobre un integrando ya compilado"""
     _validate_integration_params(a, b, n)
-    
+
     if n > 10:
         n = 10  # Limitar para estabilidad
-    
-    func = _parse_function(func_str)
-    steps = []
-    
-    # Nodos y pesos de Gauss-Legendre (precomputados para n común)
-    gauss_data = {
-        1: (np.array([0.0]), np.array([2.0])),
-        2: (np.array([-0.5773502692, 0.5773502692]), 
-            np.array([1.0, 1.0])),
-        3: (np.array([-0.7745966692, 0.0, 0.7745966692]),
-            np.array([0.5555555556, 0.8888888889, 0.5555555556])),
-        4: (np.array([-0.8611363116, -0.3399810436, 0.3399810436, 0.8611363116]),
-            np.array([0.3478548451, 0.6521451549, 0.6521451549, 0.3478548451])),
-        5: (np.array([-0.9061798459, -0.5384693101, 0.0, 0.5384693101, 0.9061798459]),
-            np.array([0.2369268851, 0.4786286705, 0.5688888889, 0.4786286705, 0.2369268851]))
-    }
-    
-    if n not in gauss_data:
-        # Para n > 5, usar numpy
-        nodes, weights = np.polynomial.legendre.leggauss(n)
-    else:
-        nodes, weights = gauss_data[n]
-    
+
+    # Nodos y pesos a precisión doble completa (las tablas a mano de 10
+    # dígitos eran menos exactas que leggauss), cacheados por n
+    nodes, weights = _gl_nodes_weights(n)
+
     # Transformar del intervalo [-1,1] a [a,b]
     transformed_nodes = (b - a) / 2 * nodes + (a + b) / 2
-    
-    steps.append({
+
+    # Evaluar la integral: una llamada vectorizada y un producto punto
+    fx = _eval_vector(func, transformed_nodes)
+    integral_sum = float(weights @ fx)
+
+    result = (b - a) / 2 * integral_sum
+
+    if not return_steps:
+        return result, []
+
+    steps = [{
         "step": "nodes",
         "description": f"Nodos de Gauss-Legendre para n={n}",
         "nodes": transformed_nodes.tolist(),
         "weights": weights.tolist()
-    })
-    
-    # Evaluar integral
-    integral_sum = 0
-    for i in range(n):
-        xi = transformed_nodes[i]
-        fxi = func(xi)
-        contribution = weights[i] * fxi
-        integral_sum += contribution
-        
-        if i < 5:  # Mostrar primeros 5
-            steps.append({
-                "step": f"eval_{i+1}",
-                "x": xi,
-                "fx": fxi,
-                "weight": weights[i],
-                "contribution": contribution
-            })
-    
-    result = (b - a) / 2 * integral_sum
-    
+    }]
+
+    # Mostrar primeros 5
+    for i in range(min(n, 5)):
+        steps.append({
+            "step": f"eval_{i+1}",
+            "x": float(transformed_nodes[i]),
+            "fx": float(fx[i]),
+            "weight": float(weights[i]),
+            "contribution": float(weights[i] * fx[i])
+        })
+
     steps.append({
         "step": "result",
         "description": "Integral = (b-a)/2 * Σ(wi * f(xi))",
         "result": result
     })
-    
+
+    return result, steps
+
+# ============= CUADRATURA ADAPTATIVA =============
+def gauss_legendre_adaptive(func_str: str, a: float, b: float,
+                            tol: float = 1e-8) -> Tuple[float, List[Dict]]:
+    """Cuadratura adaptativa por bisección sobre Gauss-Legendre de 7 puntos.
+
+    Estima cada panel con la regla de 7 puntos y lo acepta cuando las dos
+    mitades coinciden con el panel completo dentro de la tolerancia; si no,
+    bisecta con tolerancia repartida. La estimación de cada mitad se pasa al
+    nivel siguiente como su panel completo, evitando recomputarla. Para
+    integrandos suaves alcanza la tolerancia con muchas menos evaluaciones
+    que las reglas compuestas de n fijo.
+    """
+    if not isinstance(a, (int, float)) or np.isnan(a) or np.isinf(a):
+        raise ValueError(f"Límite inferior 'a' no válido: {a}")
+    if not isinstance(b, (int, float)) or np.isnan(b) or np.isinf(b):
+        raise ValueError(f"Límite superior 'b' no válido: {b}")
+    if a >= b:
+        raise ValueError(f"El límite inferior debe ser menor al superior: {a} >= {b}")
+    if not tol > 0:
+        raise ValueError(f"Tolerancia debe ser positiva: {tol}")
+
+    func = _parse_function(func_str)
+    nodes, weights = _gl_nodes_weights(7)
+    max_depth = 40
+    panel_count = 0
+
+    def _panel(lo: float, hi: float) -> float:
+        nonlocal panel_count
+        panel_count += 1
+        transformed = 0.5 * (hi - lo) * nodes + 0.5 * (lo + hi)
+        return 0.5 * (hi - lo) * float(weights @ _eval_vector(func, transformed))
+
+    def _refine(lo: float, hi: float, whole: float, tol: float, depth: int) -> float:
+        mid = 0.5 * (lo + hi)
+        left = _panel(lo, mid)
+        right = _panel(mid, hi)
+        if abs(left + right - whole) < tol or depth >= max_depth:
+            return left + right
+        # Cada mitad hereda su propia estimación como panel completo
+        return (_refine(lo, mid, left, 0.5 * tol, depth + 1) +
+                _refine(mid, hi, right, 0.5 * tol, depth + 1))
+
+    result = _refine(a, b, _panel(a, b), tol, 0)
+
+    if np.isnan(result) or np.isinf(result):
+        raise ValueError(f"El cálculo resultó en {result}. Revisa el integrando en [{a}, {b}].")
+
+    steps = [
+        {
+            "step": 1,
+            "description": f"Gauss-Legendre de 7 puntos con bisección adaptativa, tol={tol:.2e}"
+        },
+        {
+            "step": "result",
+            "description": f"Paneles evaluados: {panel_count} ({7 * panel_count} evaluaciones)",
+            "panels": panel_count,
+            "result": result
+        }
+    ]
+
     return result, steps
 
+def adaptive_quadpack(func_str: str, a: float, b: float,
+                      tol: float = 1e-8) -> Tuple[float, List[Dict]]:
+    """Integral adaptativa delegada a QUADPACK (dqags, vía scipy.integrate.quad).
+
+    QUADPACK corre por completo en código compilado y maneja singularidades
+    integrables y oscilaciones mucho mejor que las reglas compuestas. scipy
+    no es dependencia del proyecto, así que el import es opcional: sin él
+    se usa gauss_legendre_adaptive, que ofrece la misma interfaz.
+    """
+    if _scipy_quad is None:
+        return gauss_legendre_adaptive(func_str, a, b, tol)
+
+    if not isinstance(a, (int, float)) or np.isnan(a) or np.isinf(a):
+        raise ValueError(f"Límite inferior 'a' no válido: {a}")
+    if not isinstance(b, (int, float)) or np.isnan(b) or np.isinf(b):
+        raise ValueError(f"Límite superior 'b' no válido: {b}")
+    if a >= b:
+        raise ValueError(f"El límite inferior debe ser menor al superior: {a} >= {b}")
+    if not tol > 0:
+        raise ValueError(f"Tolerancia debe ser positiva: {tol}")
+
+    func = _parse_function(func_str)
+    result, abserr = _scipy_quad(func, a, b, epsabs=tol)
+
+    if np.isnan(result) or np.isinf(result):
+        raise ValueError(f"El cálculo resultó en {result}. Revisa el integrando en [{a}, {b}].")
+
+    steps = [
+        {
+            "step": 1,
+            "description": f"QUADPACK adaptativo (dqags) con tol={tol:.2e}"
+        },
+        {
+            "step": "result",
+            "description": f"Error absoluto estimado: {abserr:.2e}",
+            "error_estimate": float(abserr),
+            "result": float(result)
+        }
+    ]
+
+    return float(result), steps
+
 # ============= FUNCIONES DE EXPLICACIÓN =============
 def get_trapecio_explanation(func_str: str, a: float, b: float, n: int) -> Dict[str, Any]:
     return {
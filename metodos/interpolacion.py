@@ -3,32 +3,47 @@ from typing import List, Tuple, Dict, Any
 
 def _validate_input(x: List[float], y: List[float]) -> None:
     """Validación robusta de entrada para todos los métodos"""
-    if not x or not y:
+    if len(x) == 0 or len(y) == 0:
         raise ValueError("Las listas x e y no pueden estar vacías")
-    
+
     if len(x) != len(y):
         raise ValueError(f"x y y deben tener la misma longitud. x: {len(x)}, y: {len(y)}")
-    
+
     if len(x) < 2:
         raise ValueError("Se requieren al menos 2 puntos para interpolación")
-    
-    if len(set(x)) != len(x):
+
+    # Verificar que sean números válidos: una sola pasada vectorizada de
+    # np.isfinite en lugar de un bucle Python elemento a elemento
+    try:
+        x_arr = np.asarray(x, dtype=np.float64)
+        y_arr = np.asarray(y, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("x e y deben contener solo valores numéricos")
+
+    x_finite = np.isfinite(x_arr)
+    if not x_finite.all():
+        i = int(np.argmax(~x_finite))
+        raise ValueError(f"x[{i}] = {x[i]} no es un número válido")
+
+    y_finite = np.isfinite(y_arr)
+    if not y_finite.all():
+        i = int(np.argmax(~y_finite))
+        raise ValueError(f"y[{i}] = {y[i]} no es un número válido")
+
+    # np.unique ordena en C sin hashear floats de Python uno por uno
+    if np.unique(x_arr).size != x_arr.size:
         raise ValueError("Los valores de x deben ser únicos (no duplicados)")
-    
-    # Verificar que sean números válidos
-    for i, val in enumerate(x):
-        if not isinstance(val, (int, float)) or np.isnan(val) or np.isinf(val):
-            raise ValueError(f"x[{i}] = {val} no es un número válido")
-    
-    for i, val in enumerate(y):
-        if not isinstance(val, (int, float)) or np.isnan(val) or np.isinf(val):
-            raise ValueError(f"y[{i}] = {val} no es un número válido")
 
-def _sort_points(x: List[float], y: List[float]) -> Tuple[List[float], List[float]]:
-    """Ordena los puntos por x creciente"""
-    paired = list(zip(x, y))
-    paired.sort(key=lambda point: point[0])
-    return [p[0] for p in paired], [p[1] for p in paired]
+def _sort_points(x: List[float], y: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Ordena los puntos por x creciente (devuelve arreglos NumPy).
+
+    np.argsort ordena en C sin construir pares Python intermedios, y los
+    arreglos resultantes se indexan directamente en los métodos vectorizados.
+    """
+    x_arr = np.asarray(x, dtype=np.float64)
+    y_arr = np.asarray(y, dtype=np.float64)
+    order = np.argsort(x_arr, kind='stable')
+    return x_arr[order], y_arr[order]
 
 # ============= INTERPOLACIÓN LINEAL =============
 def linear_interpolate(x: List[float], y: List[float], xq: List[float]) -> List[float]:
@@ -38,30 +53,22 @@ def linear_interpolate(x: List[float], y: List[float], xq: List[float]) -> List[
     
     if not xq:
         raise ValueError("xq no puede estar vacío")
-    
-    result = []
-    for xi in xq:
-        if xi < x_sorted[0] or xi > x_sorted[-1]:
-            # Extrapolación lineal usando los extremos
-            if xi < x_sorted[0]:
-                # Extrapolación usando los dos primeros puntos
-                slope = (y_sorted[1] - y_sorted[0]) / (x_sorted[1] - x_sorted[0])
-                yi = y_sorted[0] + slope * (xi - x_sorted[0])
-            else:
-                # Extrapolación usando los dos últimos puntos
-                slope = (y_sorted[-1] - y_sorted[-2]) / (x_sorted[-1] - x_sorted[-2])
-                yi = y_sorted[-1] + slope * (xi - x_sorted[-1])
-        else:
-            # Interpolación
-            for i in range(len(x_sorted) - 1):
-                if x_sorted[i] <= xi <= x_sorted[i + 1]:
-                    t = (xi - x_sorted[i]) / (x_sorted[i + 1] - x_sorted[i])
-                    yi = (1 - t) * y_sorted[i] + t * y_sorted[i + 1]
-                    break
-        
-        result.append(yi)
-    
-    return result
+
+    xs, ys = x_sorted, y_sorted
+    xq_arr = np.asarray(xq, dtype=np.float64)
+    n = xs.size
+
+    # Localización del intervalo por búsqueda binaria vectorizada:
+    # O(Q log n) en una sola llamada en C en lugar del barrido O(Q·n).
+    # El recorte a [0, n-2] asigna las consultas fuera de rango al tramo
+    # extremo, lo que reproduce la extrapolación lineal con los dos
+    # primeros/últimos puntos.
+    idx = np.clip(np.searchsorted(xs, xq_arr, side='right') - 1, 0, n - 2)
+
+    t = (xq_arr - xs[idx]) / (xs[idx + 1] - xs[idx])
+    result = (1 - t) * ys[idx] + t * ys[idx + 1]
+
+    return result.tolist()
 
 # ============= POLINOMIO DE NEWTON =============
 def newton_divided_diffs(x: List[float], y: List[float]) -> Tuple[List[float], List[float]]:
@@ -70,71 +77,126 @@ def newton_divided_diffs(x: List[float], y: List[float]) -> Tuple[List[float], L
     x_sorted, y_sorted = _sort_points(x, y)
     
     n = len(x_sorted)
-    # Tabla de diferencias divididas
-    F = [[0.0 for _ in range(n)] for _ in range(n)]
-    
-    # Primera columna: valores de y
-    for i in range(n):
-        F[i][0] = y_sorted[i]
-    
-    # Calcular diferencias divididas
+    xs = x_sorted
+
+    # Tabla de diferencias divididas actualizada in-place sobre un solo
+    # vector: tras la pasada j, F[i] contiene f[x_i, ..., x_{i+j}].
+    # Memoria O(n) y n-1 restas vectorizadas en lugar de n²/2 escalares.
+    F = y_sorted.copy()
+    coefficients = [float(F[0])]
+
     for j in range(1, n):
-        for i in range(n - j):
-            denominator = x_sorted[i + j] - x_sorted[i]
-            if abs(denominator) < 1e-15:
-                raise ValueError(f"División por cero en diferencias divididas: x[{i+j}] ≈ x[{i}]")
-            F[i][j] = (F[i + 1][j - 1] - F[i][j - 1]) / denominator
-    
-    # Coeficientes del polinomio (primera fila de la tabla)
-    coefficients = [F[0][j] for j in range(n)]
-    
-    return x_sorted, coefficients
+        denominators = xs[j:] - xs[:n - j]
+        near_zero = np.abs(denominators) < 1e-15
+        if near_zero.any():
+            i = int(near_zero.argmax())
+            raise ValueError(f"División por cero en diferencias divididas: x[{i+j}] ≈ x[{i}]")
+        F[:n - j] = (F[1:n - j + 1] - F[:n - j]) / denominators
+        coefficients.append(float(F[0]))
+
+    return x_sorted.tolist(), coefficients
 
 def eval_newton_poly(x_nodes: List[float], coefficients: List[float], xq: List[float]) -> List[float]:
     """Evalúa el polinomio de Newton en los puntos xq"""
     if len(x_nodes) != len(coefficients):
         raise ValueError("x_nodes y coefficients deben tener la misma longitud")
-    
-    result = []
-    n = len(coefficients)
-    
-    for xi in xq:
-        # Esquema de Horner modificado para Newton
-        value = coefficients[n - 1]
-        for i in range(n - 2, -1, -1):
-            value = value * (xi - x_nodes[i]) + coefficients[i]
-        result.append(value)
-    
-    return result
+
+    nodes = np.asarray(x_nodes, dtype=np.float64)
+    coefs = np.asarray(coefficients, dtype=np.float64)
+    xq_arr = np.asarray(xq, dtype=np.float64)
+    n = coefs.size
+
+    # Esquema de Horner modificado para Newton, aplicado a todos los puntos
+    # de consulta a la vez: una iteración por coeficiente en lugar de Q·n
+    values = np.full(xq_arr.shape, coefs[n - 1])
+    for i in range(n - 2, -1, -1):
+        values = values * (xq_arr - nodes[i]) + coefs[i]
+
+    return values.tolist()
 
 # ============= INTERPOLACIÓN DE LAGRANGE =============
+class LagrangeInterpolator:
+    """Interpolador de Lagrange con pesos baricéntricos precalculados.
+
+    Los pesos w_i = 1/Π_{j≠i}(x_i - x_j) se calculan una sola vez en el
+    constructor (O(n²)); cada evaluación usa la segunda forma baricéntrica
+    y cuesta O(n) por consulta, así que el costo de preparación se amortiza
+    entre todas las consultas sobre los mismos nodos.
+    """
+
+    def __init__(self, x: List[float], y: List[float]) -> None:
+        _validate_input(x, y)
+
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        n = self.x.size
+
+        # Diferencias entre nodos (la diagonal se desplaza con la identidad
+        # para no dividir por cero al tomar el producto por filas)
+        node_diff = self.x[:, None] - self.x[None, :]
+        near_zero = (np.abs(node_diff) + np.eye(n)) < 1e-15
+        if near_zero.any():
+            i, j = np.argwhere(near_zero)[0]
+            raise ValueError(f"División por cero en Lagrange: x[{i}] ≈ x[{j}]")
+
+        self.weights = 1.0 / np.prod(node_diff + np.eye(n), axis=1)
+
+    def __call__(self, xq: List[float]) -> List[float]:
+        xq_arr = np.asarray(xq, dtype=np.float64)
+
+        # Segunda forma baricéntrica:
+        # P(xq) = Σ wᵢyᵢ/(xq-xᵢ) / Σ wᵢ/(xq-xᵢ)
+        diff = xq_arr[:, None] - self.x[None, :]
+        exact_hit = diff == 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = self.weights[None, :] / diff
+            result = (ratios @ self.y) / ratios.sum(axis=1)
+
+        # Las consultas que caen exactamente en un nodo devuelven su y
+        hit_rows, hit_cols = np.nonzero(exact_hit)
+        result[hit_rows] = self.y[hit_cols]
+
+        return result.tolist()
+
 def lagrange_interpolate(x: List[float], y: List[float], xq: List[float]) -> List[float]:
-    """Interpolación usando polinomios de Lagrange"""
-    _validate_input(x, y)
-    
-    result = []
-    n = len(x)
-    
-    for xi in xq:
-        total = 0.0
-        
-        for i in range(n):
-            # Calcular Li(xi)
-            li = 1.0
-            for j in range(n):
-                if i != j:
-                    denominator = x[i] - x[j]
-                    if abs(denominator) < 1e-15:
-                        raise ValueError(f"División por cero en Lagrange: x[{i}] ≈ x[{j}]")
-                    li *= (xi - x[j]) / denominator
-            
-            total += y[i] * li
-        
-        result.append(total)
-    
-    return result
+    """Interpolación usando polinomios de Lagrange.
+
+    Envoltorio de una sola llamada sobre LagrangeInterpolator; para evaluar
+    repetidamente sobre los mismos nodos conviene construir el interpolador
+    una vez y reutilizarlo.
+    """
+    return LagrangeInterpolator(x, y)(xq)
 
 # ============= SPLINES CÚBICOS =============
+def _thomas_solve(lower: np.ndarray, diag: np.ndarray, upper: np.ndarray,
+                  rhs: np.ndarray) -> np.ndarray:
+    """Resuelve un sistema tridiagonal con el algoritmo de Thomas.
+
+    Tiempo y memoria O(n), frente al O(n³)/O(n²) de ensamblar la matriz
+    densa y factorizarla con np.linalg.solve. El sistema del spline es
+    diagonal dominante, así que la eliminación sin pivoteo es estable.
+    """
+    m = diag.size
+    if m == 1:
+        return rhs / diag
+
+    sweep_upper = np.empty(m - 1)
+    sweep_rhs = np.empty(m)
+
+    sweep_upper[0] = upper[0] / diag[0]
+    sweep_rhs[0] = rhs[0] / diag[0]
+    for i in range(1, m):
+        denom = diag[i] - lower[i - 1] * sweep_upper[i - 1]
+        if i < m - 1:
+            sweep_upper[i] = upper[i] / denom
+        sweep_rhs[i] = (rhs[i] - lower[i - 1] * sweep_rhs[i - 1]) / denom
+
+    solution = np.empty(m)
+    solution[-1] = sweep_rhs[-1]
+    for i in range(m - 2, -1, -1):
+        solution[i] = sweep_rhs[i] - sweep_upper[i] * solution[i + 1]
+    return solution
+
 def cubic_spline_interpolate(x: List[float], y: List[float], xq: List[float]) -> List[float]:
     """Interpolación con splines cúbicos naturales"""
     _validate_input(x, y)
@@ -144,61 +206,53 @@ def cubic_spline_interpolate(x: List[float], y: List[float], xq: List[float]) ->
     
     if n < 3:
         # Para menos de 3 puntos, usar interpolación lineal
-        return linear_interpolate(x_sorted, y_sorted, xq)
-    
+        return linear_interpolate(x_sorted.tolist(), y_sorted.tolist(), xq)
+
     # Calcular espaciamientos
-    h = [x_sorted[i + 1] - x_sorted[i] for i in range(n - 1)]
-    
-    # Sistema tridiagonal para encontrar segundas derivadas
-    A = np.zeros((n - 2, n - 2))
-    b = np.zeros(n - 2)
-    
-    for i in range(n - 2):
-        if i > 0:
-            A[i, i - 1] = h[i]
-        A[i, i] = 2 * (h[i] + h[i + 1])
-        if i < n - 3:
-            A[i, i + 1] = h[i + 1]
-        
-        b[i] = 6 * ((y_sorted[i + 2] - y_sorted[i + 1]) / h[i + 1] - 
-                   (y_sorted[i + 1] - y_sorted[i]) / h[i])
-    
+    h_arr = np.diff(x_sorted)
+
+    # Sistema tridiagonal para las segundas derivadas, en forma de bandas:
+    # subdiagonal/superdiagonal h[1:-1], diagonal 2(h_i + h_{i+1})
+    diag = 2.0 * (h_arr[:-1] + h_arr[1:])
+    off_diag = h_arr[1:-1]
+    b = 6.0 * np.diff(np.diff(y_sorted) / h_arr)
+
     # Resolver sistema (splines naturales: S''(x0) = S''(xn) = 0)
-    if n > 2:
-        second_derivs_inner = np.linalg.solve(A, b)
-        second_derivs = np.zeros(n)
-        second_derivs[1:-1] = second_derivs_inner
-    else:
-        second_derivs = np.zeros(n)
+    second_derivs = np.zeros(n)
+    second_derivs[1:-1] = _thomas_solve(off_diag, diag, off_diag, b)
     
-    # Evaluar splines
-    result = []
-    for xi in xq:
-        # Encontrar intervalo
-        if xi <= x_sorted[0]:
-            # Extrapolación lineal
-            slope = (y_sorted[1] - y_sorted[0]) / h[0]
-            yi = y_sorted[0] + slope * (xi - x_sorted[0])
-        elif xi >= x_sorted[-1]:
-            # Extrapolación lineal
-            slope = (y_sorted[-1] - y_sorted[-2]) / h[-1]
-            yi = y_sorted[-1] + slope * (xi - x_sorted[-1])
-        else:
-            # Interpolación con spline
-            for i in range(n - 1):
-                if x_sorted[i] <= xi <= x_sorted[i + 1]:
-                    dx = xi - x_sorted[i]
-                    
-                    yi = (y_sorted[i] + 
-                          dx * ((y_sorted[i + 1] - y_sorted[i]) / h[i] - 
-                               h[i] * (2 * second_derivs[i] + second_derivs[i + 1]) / 6) +
-                          dx**2 * second_derivs[i] / 2 +
-                          dx**3 * (second_derivs[i + 1] - second_derivs[i]) / (6 * h[i]))
-                    break
-        
-        result.append(yi)
-    
-    return result
+    # Evaluar splines; el intervalo de cada consulta se localiza con una
+    # sola búsqueda binaria vectorizada en lugar de un barrido O(n) por punto
+    xs, ys = x_sorted, y_sorted
+    xq_arr = np.asarray(xq, dtype=np.float64)
+    idx = np.clip(np.searchsorted(xs, xq_arr, side='right') - 1, 0, n - 2)
+
+    # Recolectar una sola vez los valores del tramo de cada consulta y
+    # evaluar el polinomio cúbico como una única expresión vectorizada,
+    # en lugar de releer y_sorted/h/second_derivs varias veces por punto
+    yi_l = ys[idx]
+    yi_r = ys[idx + 1]
+    hi = h_arr[idx]
+    sdl = second_derivs[idx]
+    sdr = second_derivs[idx + 1]
+    dx = xq_arr - xs[idx]
+
+    result = (yi_l +
+              dx * ((yi_r - yi_l) / hi - hi * (2 * sdl + sdr) / 6) +
+              dx**2 * sdl / 2 +
+              dx**3 * (sdr - sdl) / (6 * hi))
+
+    # Fuera del rango se extrapola linealmente con el tramo extremo
+    below = xq_arr <= xs[0]
+    above = xq_arr >= xs[-1]
+    if below.any():
+        slope = (ys[1] - ys[0]) / h_arr[0]
+        result[below] = ys[0] + slope * (xq_arr[below] - xs[0])
+    if above.any():
+        slope = (ys[-1] - ys[-2]) / h_arr[-1]
+        result[above] = ys[-1] + slope * (xq_arr[above] - xs[-1])
+
+    return result.tolist()
 
 # ============= FUNCIONES DE EXPLICACIÓN =============
 def get_linear_explanation(x: List[float], y: List[float], xq: List[float]) -> Dict[str, Any]: